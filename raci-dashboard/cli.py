@@ -2,22 +2,31 @@
 """
 RACI Dashboard CLI — parse any RACI spreadsheet and launch an interactive dashboard.
 
-Usage:
-    python cli.py my_raci.xlsx                     # Launch dashboard
-    python cli.py my_raci.xlsx --sheet "Sheet1"    # Specify sheet
-    python cli.py my_raci.xlsx --export out.html   # Export self-contained HTML
-    python cli.py my_raci.xlsx --json output.json  # Export parsed JSON
+Run without arguments for usage examples.
 """
 
 import argparse
-import json
 import os
 import sys
 
-from parser import parse_file
+# Printed when no file is given; kept out of __doc__, which python -OO strips
+_USAGE = """\
+Usage:
+    python cli.py my_raci.xlsx                     # Launch dashboard
+    python cli.py my_raci.xlsx --sheet "Sheet1"    # Specify sheet
+    python cli.py my_raci.xlsx --export out.html   # Export self-contained HTML
+    python cli.py my_raci.xlsx --json output.json  # Export parsed JSON
+    python cli.py my_raci.xlsx --powerbi out_dir/  # Export Power BI starter kit
+    python cli.py --help                           # All options
+"""
 
 
 def main():
+    # Bare invocation: print the static usage text without building the parser
+    if len(sys.argv) < 2:
+        sys.stdout.write(_USAGE)
+        sys.exit(0)
+
     ap = argparse.ArgumentParser(
         description='RACI Dashboard — interactive visualization for RACI spreadsheets'
     )
@@ -43,6 +52,11 @@ def main():
         metavar='OUTPUT.json',
         help='Export parsed data as JSON'
     )
+    ap.add_argument(
+        '--json-pretty',
+        action='store_true',
+        help='Indent the --json output (default: compact)'
+    )
     ap.add_argument(
         '--powerbi',
         default=None,
@@ -64,18 +78,19 @@ def main():
     args = ap.parse_args()
 
     if not args.file:
-        ap.print_help()
+        sys.stdout.write(_USAGE)
         sys.exit(0)
 
     filepath = args.file
-    if not os.path.exists(filepath):
-        print(f"Error: File not found: {filepath}", file=sys.stderr)
-        sys.exit(1)
 
-    # Parse the file
+    # Parse the file (imported here so --help and usage errors skip parser startup)
+    from parser import parse_file
     print(f"Parsing: {filepath}")
     try:
         data = parse_file(filepath, args.sheet)
+    except FileNotFoundError:
+        print(f"Error: File not found: {filepath}", file=sys.stderr)
+        sys.exit(1)
     except ValueError as e:
         print(f"Error: {e}", file=sys.stderr)
         sys.exit(1)
@@ -83,31 +98,41 @@ def main():
         print(f"Error reading file: {e}", file=sys.stderr)
         sys.exit(1)
 
-    # Print validation report
+    # Print validation report (built up front and written in one call)
     meta = data['meta']
-    print(f"\n  Sheet:        {meta['sheet']}")
-    print(f"  Roles:        {meta['role_count']}")
-    print(f"  Categories:   {meta['category_count']}")
-    print(f"  Capabilities: {meta['capability_count']}")
+    report = [
+        f"\n  Sheet:        {meta['sheet']}\n",
+        f"  Roles:        {meta['role_count']}\n",
+        f"  Categories:   {meta['category_count']}\n",
+        f"  Capabilities: {meta['capability_count']}\n",
+    ]
     if meta.get('has_maturity'):
-        print(f"  Maturity:     detected")
-    if meta.get('orphaned_capabilities'):
-        print(f"\n  Warning: {len(meta['orphaned_capabilities'])} capabilities with no R assigned:")
-        for cap in meta['orphaned_capabilities'][:10]:
-            print(f"    - {cap}")
-        if len(meta['orphaned_capabilities']) > 10:
-            print(f"    ... and {len(meta['orphaned_capabilities']) - 10} more")
+        report.append("  Maturity:     detected\n")
+    orphaned = meta.get('orphaned_capabilities')
+    if orphaned:
+        report.append(f"\n  Warning: {len(orphaned)} capabilities with no R assigned:\n")
+        report.extend(f"    - {cap}\n" for cap in orphaned[:10])
+        if len(orphaned) > 10:
+            report.append(f"    ... and {len(orphaned) - 10} more\n")
     if meta.get('zero_r_roles'):
-        print(f"\n  Warning: Roles with zero R assignments: {', '.join(meta['zero_r_roles'])}")
+        report.append(f"\n  Warning: Roles with zero R assignments: {', '.join(meta['zero_r_roles'])}\n")
 
-    print("\n  Column classifications:")
-    for ci, info in sorted(meta.get('column_classifications', {}).items()):
-        print(f"    Col {ci}: {info['header']!r:30s} → {info['classification']}")
+    report.append("\n  Column classifications:\n")
+    report.extend(
+        f"    Col {ci}: {info['header']!r:30s} → {info['classification']}\n"
+        for ci, info in sorted(meta.get('column_classifications', {}).items())
+    )
+    sys.stdout.write(''.join(report))
 
-    # JSON export
+    # JSON export (compact output is reused as the HTML export's payload)
+    payload = None
     if args.json:
-        with open(args.json, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        from jsonutil import dumps_json
+        payload = dumps_json(data, pretty=args.json_pretty)
+        with open(args.json, 'wb') as f:
+            f.write(payload)
+        if args.json_pretty:
+            payload = None
         print(f"\n  JSON exported to: {args.json}")
         if not args.export:
             return
@@ -125,7 +150,7 @@ def main():
     # HTML export
     if args.export:
         from export import export_html
-        export_html(data, args.export)
+        export_html(data, args.export, data_json=payload)
         print(f"\n  HTML dashboard exported to: {args.export}")
         return
 
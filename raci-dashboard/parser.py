@@ -20,11 +20,31 @@ Handles:
   - Transposed layouts (roles as rows)
 """
 
+import copy
 import csv
+import datetime
+import functools
 import io
+import itertools
 import os
+import posixpath
 import re
-RACI_VALUES = {'R', 'A', 'C', 'I'}
+import threading
+import zipfile
+from collections import OrderedDict, defaultdict
+from xml.etree import ElementTree
+
+try:
+    from python_calamine import CalamineSheet, CalamineWorkbook
+except ImportError:  # optional: openpyxl is used when python-calamine is not installed
+    CalamineWorkbook = None
+else:
+    # Releases before 0.4.0 can't report merged cells; parsing without
+    # them would differ from openpyxl, so use openpyxl instead
+    if not hasattr(CalamineSheet, 'merged_cell_ranges'):
+        CalamineWorkbook = None
+
+RACI_VALUES = frozenset({'R', 'A', 'C', 'I'})
 
 # Extended RACI variants mapped to standard R/A/C/I
 RACI_EXTENDED = {
@@ -55,10 +75,17 @@ RACI_FULLWORDS = {
     'yes': 'R', 'y': 'R',  # Some sheets use Y/N
 }
 
+# File extensions parse_file accepts
+XLSX_EXTENSIONS = ('.xlsx', '.xls')
+SUPPORTED_EXTENSIONS = ('.csv',) + XLSX_EXTENSIONS
+
+# Longest cell text still considered as a possible RACI value
+RACI_MAX_LEN = 40
+
 # Responsibility priority (higher = more responsible)
 RACI_PRIORITY = {'R': 4, 'A': 3, 'C': 2, 'I': 1}
 
-MATURITY_RANGE = {0, 1, 2, 3, 4, 5}
+MATURITY_RANGE = frozenset({0, 1, 2, 3, 4, 5})
 
 ROLE_PALETTE = [
     "#4ae0b0", "#e0a040", "#6090e0", "#a0b8d0",
@@ -112,27 +139,102 @@ HEADER_KEYWORDS = {
     ],
 }
 
+# Pre-lowercased keyword tuples per group ('Δ' is the only mixed-case entry)
+HEADER_KEYWORDS_LOWER = {
+    group: tuple(kw.lower() for kw in keywords)
+    for group, keywords in HEADER_KEYWORDS.items()
+}
+
 # Keywords that indicate maturity_target vs maturity_now
-TARGET_KEYWORDS = [
+TARGET_KEYWORDS = (
     'target', 'tgt', 'future', 'goal', 'projected', 'to-be', 'to be',
     'desired', 'planned', 'expected', 'with',
-]
-UNFILLED_KEYWORDS = ['open', 'unfilled', 'vacant', '★', 'tbd', 'tbc', 'hire', 'needed', 'new']
+)
+UNFILLED_KEYWORDS = ('open', 'unfilled', 'vacant', '★', 'tbd', 'tbc', 'hire', 'needed', 'new')
 
 # Patterns that indicate a row is a summary/aggregate (not a real capability)
-SUMMARY_KEYWORDS = [
+SUMMARY_KEYWORDS = (
     'average', 'avg', 'total', 'sum', 'count', 'mean', 'median',
     'grand total', 'subtotal', 'sub-total', 'summary',
     'category average', 'section total',
-]
+)
 
 # Patterns that indicate a category is a footer/summary section (not real data)
-SUMMARY_CATEGORY_KEYWORDS = [
+SUMMARY_CATEGORY_KEYWORDS = (
     'average', 'avg', 'total', 'sum', 'count', 'legend', 'key',
     'summary', 'appendix', 'reference', 'notes', 'glossary',
     'responsible (r)', 'accountable (a)', 'consulted (c)', 'informed (i)',
     'raci legend', 'raci key', 'raci count', 'count by role',
-]
+)
+
+# Rows sampled per column when classifying columns; a column whose stats land
+# within SAMPLE_MARGIN of a classification threshold is re-scanned in full
+SAMPLE_ROWS = 500
+SAMPLE_MARGIN = 0.1
+
+# Parsed results kept by parse_file, most recently used last
+PARSE_CACHE_SIZE = 16
+_PARSE_CACHE = OrderedDict()
+_PARSE_CACHE_LOCK = threading.Lock()
+
+# Sampling window used when scoring sheets in a multi-sheet workbook
+SHEET_SAMPLE_ROWS = 31
+SHEET_SAMPLE_COLS = 40
+SHEET_SAMPLE_CELLS = 500
+
+# Largest sheet the parser accepts; bounds worst-case parse time
+MAX_ROWS = 50_000
+MAX_COLS = 200
+# Bytes read from the start of a worksheet part to find its <dimension>
+SHEET_HEAD_BYTES = 64 * 1024
+
+
+# Precompiled patterns for the per-cell / per-label helpers below
+_RE_SPLIT_RACI = re.compile(r'[/,&\s]+')
+_RE_WORDS = re.compile(r'[A-Z][a-z]*|[a-z]+')
+_RE_CONSONANTS = re.compile(r'[aeiou\s\W]', re.IGNORECASE)
+_RE_ID_STRIP = re.compile(r'[^a-zA-Z0-9\s]')
+_RE_ID_SPACES = re.compile(r'\s+')
+_RE_CAT_NUM = re.compile(r'^[\d]+[.):\-]\s*')
+_RE_CAT_ALPHA = re.compile(r'^[a-zA-Z][.)]\s*')
+_RE_CAT_BULLET = re.compile(r'^[•●○◦▪▸►→–—]\s*')
+_RE_NUMERIC = re.compile(r'^[\d.,%]+$')
+_RE_INT_FLOAT = re.compile(r'^[\d]+\.?[\d]*$')
+_RE_CELL_REF = re.compile(r'\$?([A-Za-z]{1,3})\$?(\d+)$')
+_RE_DIMENSION = re.compile(rb'<(?:\w+:)?dimension\b[^>]*?\bref="([^"]+)"')
+_RE_ACTIVE_TAB = re.compile(rb'<(?:\w+:)?workbookView\b[^>]*?\bactiveTab="(\d+)"')
+
+# str.translate equivalents of _RE_ID_STRIP and _RE_CONSONANTS for the common
+# all-ASCII label; non-ASCII labels still go through the regexes
+_ID_STRIP_TABLE = {
+    i: None for i in range(128)
+    if not (chr(i).isalnum() or chr(i).isspace())
+}
+_CONSONANT_TABLE = {
+    i: None for i in range(128)
+    if chr(i).lower() in 'aeiou' or chr(i).isspace()
+    or not (chr(i).isalnum() or chr(i) == '_')
+}
+
+
+# Header keyword matchers: one alternation per HEADER_KEYWORDS group, matching
+# when any keyword is a substring of the lowercased header
+_HEADER_KW_RE = {
+    group: re.compile('|'.join(map(re.escape, keywords)))
+    for group, keywords in HEADER_KEYWORDS_LOWER.items()
+}
+# ID headers must be the whole header, or a keyword followed/preceded by
+# separators (e.g. "ref #", "# id")
+_ID_KW_ALT = '|'.join(map(re.escape, HEADER_KEYWORDS_LOWER['id']))
+_RE_ID_HEADER = re.compile(rf'^(?:{_ID_KW_ALT})(?:[\s._#\-]|$)|^[\s._#\-]+(?:{_ID_KW_ALT})$')
+# Leading full RACI word; alternatives keep RACI_FULLWORDS order, so the
+# first listed word that prefixes the cell wins, as with a startswith loop
+_RE_FULLWORD_PREFIX = re.compile('|'.join(map(re.escape, RACI_FULLWORDS)))
+# Row/category/role-header keyword scans, one substring alternation per list
+_RE_TARGET = re.compile('|'.join(map(re.escape, TARGET_KEYWORDS)))
+_RE_UNFILLED = re.compile('|'.join(map(re.escape, UNFILLED_KEYWORDS)))
+_RE_SUMMARY_ROW = re.compile('|'.join(map(re.escape, SUMMARY_KEYWORDS)))
+_RE_SUMMARY_CAT = re.compile('|'.join(map(re.escape, SUMMARY_CATEGORY_KEYWORDS)))
 
 
 def _cell_str(val):
@@ -162,27 +264,34 @@ def _normalize_raci(val):
 
     Returns the RACI letter or '' if not recognized.
     """
-    s = _cell_str(val)
-    if not s:
+    if val is None:
         return ''
+    s = str(val).strip()
+    # RACI cells are short; long text (names, descriptions) never is one.
+    # Checked before the cache so such cells don't evict the real tokens.
+    if not s or len(s) > RACI_MAX_LEN:
+        return ''
+    return _normalize_raci_str(s)
 
-    upper = s.upper()
-
-    # Single standard RACI letter
-    if upper in RACI_VALUES:
-        return upper
-
-    # Single extended letter
-    if upper in RACI_EXTENDED:
-        return RACI_EXTENDED[upper]
 
-    # Full word match (case-insensitive)
+@functools.lru_cache(maxsize=4096)
+def _normalize_raci_str(s):
+    """
+    Cached body of _normalize_raci, keyed on the exact stripped cell string.
+    RACI sheets repeat a handful of tokens across thousands of cells, so
+    most calls are a cache hit. The cache is per-process. s is non-empty
+    and at most RACI_MAX_LEN characters long.
+    """
+    upper = s.upper()
     lower = s.lower()
-    if lower in RACI_FULLWORDS:
-        return RACI_FULLWORDS[lower]
+
+    # Single standard/extended letter, or full word (case-insensitive)
+    letter = RACI_EXTENDED.get(upper) or RACI_FULLWORDS.get(lower)
+    if letter:
+        return letter
 
     # Multi-value: split on / , & and pick highest priority
-    parts = re.split(r'[/,&\s]+', upper)
+    parts = _RE_SPLIT_RACI.split(upper)
     mapped = []
     for p in parts:
         p = p.strip()
@@ -192,9 +301,9 @@ def _normalize_raci(val):
         return max(mapped, key=lambda x: RACI_PRIORITY.get(x, 0))
 
     # Partial word match (starts with a known word)
-    for word, letter in RACI_FULLWORDS.items():
-        if lower.startswith(word):
-            return letter
+    m = _RE_FULLWORD_PREFIX.match(lower)
+    if m:
+        return RACI_FULLWORDS[m.group()]
 
     return ''
 
@@ -204,50 +313,64 @@ def _is_raci(val):
     return _normalize_raci(val) != ''
 
 
+def _to_float(val):
+    """
+    Parse a cell as a number, allowing a trailing '%'.
+    Numeric cells (as openpyxl returns them) skip the string round-trip.
+    Returns None if the value is not numeric.
+    """
+    if isinstance(val, (int, float)) and not isinstance(val, bool):
+        return float(val)
+    s = _cell_str(val).rstrip('%').strip()
+    try:
+        return float(s)
+    except (ValueError, TypeError):
+        return None
+
+
 def _is_maturity_number(val, scale_max=5):
     """Check if value is a maturity number (0 to scale_max)."""
-    s = _cell_str(val)
-    if s == '':
+    if val is None:
         return False
-    # Strip % sign
-    s = s.rstrip('%').strip()
-    try:
-        n = float(s)
-        return 0 <= n <= max(scale_max, 5)
-    except (ValueError, TypeError):
+    if isinstance(val, (int, float)) and not isinstance(val, bool):
+        return 0 <= val <= max(scale_max, 5)
+    return _is_maturity_str(str(val).strip(), scale_max)
+
+
+@functools.lru_cache(maxsize=4096)
+def _is_maturity_str(s, scale_max):
+    """Cached body of _is_maturity_number, keyed on the stripped cell string."""
+    if s == '':
         return False
+    n = _to_float(s)
+    return n is not None and 0 <= n <= max(scale_max, 5)
 
 
 def _detect_maturity_scale(values):
     """
-    Detect the maturity scale from a list of numeric values.
+    Detect the maturity scale from a list of numeric values
+    (cells or already-parsed floats).
     Returns (scale_max, is_percentage).
     Common scales: 0-5, 0-10, 0-100 (percentage).
     """
-    nums = []
+    # Single pass with a running max; anything above 10 already settles on
+    # the percentage scale, so stop there
+    max_val = None
     for v in values:
-        s = _cell_str(v).rstrip('%').strip()
-        try:
-            nums.append(float(s))
-        except (ValueError, TypeError):
+        n = _to_float(v)
+        if n is None:
             continue
-    if not nums:
-        return 5, False
-    max_val = max(nums)
-    if max_val > 10:
-        return 100, True  # percentage scale
-    elif max_val > 5:
+        if max_val is None or n > max_val:
+            max_val = n
+            if max_val > 10:
+                return 100, True  # percentage scale
+    if max_val is not None and max_val > 5:
         return 10, False
     return 5, False
 
 
-def _normalize_maturity(val, scale_max=5):
-    """Convert a maturity value to 0-5 scale."""
-    s = _cell_str(val).rstrip('%').strip()
-    try:
-        n = float(s)
-    except (ValueError, TypeError):
-        return None
+def _scale_maturity(n, scale_max=5):
+    """Convert an already-parsed maturity number to 0-5 scale."""
     if scale_max == 100:
         return round(n / 20)  # 0-100 → 0-5
     elif scale_max == 10:
@@ -262,13 +385,16 @@ def _make_short_code(label):
     if len(label) <= 5:
         return label.upper()
     # Try initials from multi-word labels
-    words = re.findall(r'[A-Z][a-z]*|[a-z]+', label)
+    words = _RE_WORDS.findall(label)
     if len(words) >= 2:
         initials = ''.join(w[0] for w in words if w[0].isalpha())
         if 2 <= len(initials) <= 5:
             return initials.upper()
     # Try uppercase consonants
-    consonants = re.sub(r'[aeiou\s\W]', '', label, flags=re.IGNORECASE)
+    if label.isascii():
+        consonants = label.translate(_CONSONANT_TABLE)
+    else:
+        consonants = _RE_CONSONANTS.sub('', label)
     if len(consonants) >= 3:
         return consonants[:4].upper()
     # Fallback: first 4 characters
@@ -277,93 +403,320 @@ def _make_short_code(label):
 
 def _make_id(label):
     """Create a snake_case id from label."""
-    s = re.sub(r'[^a-zA-Z0-9\s]', '', label)
-    s = re.sub(r'\s+', '_', s.strip())
+    if label.isascii():
+        s = label.translate(_ID_STRIP_TABLE)
+    else:
+        s = _RE_ID_STRIP.sub('', label)
+    s = _RE_ID_SPACES.sub('_', s.strip())
     return s.lower()
 
 
 def _detect_unfilled(header_text):
     """Detect if a role header indicates an unfilled position."""
-    ht = header_text.lower()
-    return any(kw in ht for kw in UNFILLED_KEYWORDS)
+    return _RE_UNFILLED.search(header_text.lower()) is not None
 
 
 def _is_summary_row(name_val):
     """Check if a row name indicates it's a summary/aggregate row."""
-    lower = name_val.lower().strip()
-    return any(kw in lower for kw in SUMMARY_KEYWORDS)
+    return _RE_SUMMARY_ROW.search(name_val.lower()) is not None
 
 
 def _is_summary_category(cat_name):
     """Check if a category name indicates it's a footer/summary section."""
-    lower = cat_name.lower().strip()
-    return any(kw in lower for kw in SUMMARY_CATEGORY_KEYWORDS)
+    return _RE_SUMMARY_CAT.search(cat_name.lower()) is not None
 
 
 def _strip_category_numbering(name):
     """Remove leading numbers/bullets from category names: '1. Strategy' → 'Strategy'."""
     # Strip "1.", "1)", "1 -", "a.", "a)", bullet chars
-    s = re.sub(r'^[\d]+[.):\-]\s*', '', name.strip())
-    s = re.sub(r'^[a-zA-Z][.)]\s*', '', s)
-    s = re.sub(r'^[•●○◦▪▸►→–—]\s*', '', s)
+    s = _RE_CAT_NUM.sub('', name.strip())
+    s = _RE_CAT_ALPHA.sub('', s)
+    s = _RE_CAT_BULLET.sub('', s)
     return s.strip() or name.strip()
 
 
-def _load_xlsx(filepath, sheet_name=None):
-    """Load an Excel file and return rows as list of lists + sheet name used."""
+def _load_xlsx(source, sheet_name=None):
+    """
+    Load an Excel file and return rows as list of lists + sheet name used.
+    source is a path or a seekable binary file object.
+    """
+    if CalamineWorkbook is not None and _calamine_fits(source, sheet_name):
+        return _load_xlsx_calamine(source, sheet_name)
     from openpyxl import load_workbook
-    wb = load_workbook(filepath, data_only=True)
-    if sheet_name:
-        if sheet_name in wb.sheetnames:
-            ws = wb[sheet_name]
+    # Read-only mode streams rows from the sheet XML, so an oversized sheet
+    # is rejected without loading every cell first
+    wb = load_workbook(source, read_only=True, data_only=True)
+    try:
+        if sheet_name:
+            if sheet_name in wb.sheetnames:
+                ws = wb[sheet_name]
+            else:
+                raise ValueError(
+                    f"Sheet '{sheet_name}' not found. Available: {wb.sheetnames}"
+                )
         else:
+            ws = _pick_best_sheet(wb)
+        used_sheet = ws.title
+
+        # The stored dimensions may be missing or wrong; read the real extent
+        ws.reset_dimensions()
+        rows = _capped_rows(ws.iter_rows(values_only=True))
+
+        # Handle merged cells: openpyxl with data_only fills the top-left,
+        # rest are None. Read-only sheets don't load the merged ranges, so
+        # they are read from the sheet XML once the size checks have passed.
+        _fill_merged(rows, _xlsx_merged_ranges(source, used_sheet))
+    finally:
+        wb.close()
+    return rows, used_sheet
+
+
+def _load_xlsx_calamine(source, sheet_name=None):
+    """
+    Load an Excel file through python-calamine (Rust reader, several times
+    faster than openpyxl). Cell values are mapped to what openpyxl returns,
+    so both backends feed the same rows to the parser.
+    """
+    if isinstance(source, (str, os.PathLike)):
+        wb = CalamineWorkbook.from_path(source)
+    else:
+        wb = CalamineWorkbook.from_filelike(source)
+    names = wb.sheet_names
+    sheets = {}
+
+    def get_sheet(name):
+        # Each sheet is loaded whole, so only the latest one is kept alive
+        if name not in sheets:
+            sheets.clear()
+            sheets[name] = wb.get_sheet_by_name(name)
+        return sheets[name]
+
+    if sheet_name:
+        if sheet_name not in names:
             raise ValueError(
-                f"Sheet '{sheet_name}' not found. Available: {wb.sheetnames}"
+                f"Sheet '{sheet_name}' not found. Available: {names}"
             )
+        used_sheet = sheet_name
+    elif len(names) == 1:
+        used_sheet = names[0]
     else:
-        ws = _pick_best_sheet(wb)
-    used_sheet = ws.title
+        # Fall back to the active sheet, as openpyxl's wb.active does
+        active = _xlsx_active_index(source)
+        used_sheet = _best_sheet_name(
+            names, lambda name: get_sheet(name).iter_rows(),
+            names[active] if active < len(names) else names[0]
+        )
+    sheet = get_sheet(used_sheet)
+
+    # xlsx sheets that declare an extent past the limits never reach
+    # calamine (see _calamine_fits). Sheets whose real extent is still too
+    # large (.xls files, or a wrong declaration) are read lazily up to them.
+    end_row, end_col = sheet.end or (-1, -1)
+    if end_row < MAX_ROWS and end_col < MAX_COLS:
+        rows = [[_calamine_cell(v) for v in row]
+                for row in sheet.to_python(skip_empty_area=False)]
+    else:
+        rows = _capped_rows(_calamine_rows(sheet), _calamine_cell)
+
+    # Merged ranges come back 0-based and inclusive
+    _fill_merged(rows, (
+        (r0 + 1, c0 + 1, r1 + 1, c1 + 1)
+        for (r0, c0), (r1, c1) in (sheet.merged_cell_ranges or ())
+    ))
+    return rows, used_sheet
 
-    rows = []
-    for row in ws.iter_rows(values_only=True):
-        rows.append(list(row))
 
-    # Handle merged cells: if the workbook has merged cell ranges,
-    # openpyxl with data_only fills the top-left, rest are None.
-    # Re-open without data_only to get merged ranges, then fill values.
+def _xlsx_active_index(source):
+    """
+    Index of the workbook's active sheet (workbookView activeTab), read
+    from xl/workbook.xml. Returns 0 when it can't be read (e.g. for .xls).
+    """
     try:
-        wb2 = load_workbook(filepath)
-        ws2 = wb2[used_sheet]
-        for merge_range in ws2.merged_cells.ranges:
-            min_row = merge_range.min_row
-            max_row = merge_range.max_row
-            min_col = merge_range.min_col
-            max_col = merge_range.max_col
-            # Get the value from the top-left cell
-            val = rows[min_row - 1][min_col - 1] if min_row - 1 < len(rows) else None
-            for r in range(min_row - 1, min(max_row, len(rows))):
-                for c in range(min_col - 1, min(max_col, len(rows[r]) if r < len(rows) else 0)):
-                    rows[r][c] = val
-    except Exception:
-        pass  # If merge detection fails, proceed with what we have
+        with zipfile.ZipFile(source) as zf:
+            xml = zf.read('xl/workbook.xml')
+    except (zipfile.BadZipFile, KeyError, OSError):
+        return 0
+    m = _RE_ACTIVE_TAB.search(xml)
+    return int(m.group(1)) if m else 0
+
+
+def _xlsx_sheet_paths(zf):
+    """
+    Map each worksheet's name to its XML part in an open xlsx archive,
+    following the sheet relationships in xl/workbook.xml.
+    """
+    targets = {}
+    for rel in ElementTree.fromstring(zf.read('xl/_rels/workbook.xml.rels')):
+        if rel.get('Type', '').endswith('/worksheet'):
+            target = rel.get('Target', '')
+            if target.startswith('/'):
+                targets[rel.get('Id')] = target[1:]
+            else:
+                targets[rel.get('Id')] = posixpath.normpath('xl/' + target)
+    paths = {}
+    for el in ElementTree.fromstring(zf.read('xl/workbook.xml')).iter():
+        if el.tag.endswith('}sheet'):
+            rel_id = next((v for k, v in el.attrib.items() if k.endswith('}id')), None)
+            if rel_id in targets:
+                paths[el.get('name')] = targets[rel_id]
+    return paths
+
+
+def _calamine_fits(source, sheet_name=None):
+    """
+    Whether calamine can load the workbook without breaking the size
+    limits. calamine reads a whole sheet into memory before any of it can
+    be checked, so every sheet it would load (the named one, or all of them
+    when scoring) must declare an extent within MAX_ROWS / MAX_COLS.
+    Sheets that are larger, or that declare no extent, are left to
+    openpyxl's streaming reader. Files that aren't xlsx (.xls) can't be
+    checked this way and stay with calamine.
+    """
+    try:
+        with zipfile.ZipFile(source) as zf:
+            paths = _xlsx_sheet_paths(zf)
+            if sheet_name:
+                paths = {sheet_name: paths[sheet_name]} if sheet_name in paths else {}
+            for path in paths.values():
+                extent = _xlsx_sheet_extent(zf, path)
+                if extent is None or extent[0] > MAX_ROWS or extent[1] > MAX_COLS:
+                    return False
+    except (zipfile.BadZipFile, KeyError, OSError, ValueError, ElementTree.ParseError):
+        return True
+    finally:
+        if not isinstance(source, (str, os.PathLike)):
+            source.seek(0)
+    return True
 
-    return rows, used_sheet
+
+def _xlsx_sheet_extent(zf, path):
+    """
+    Return the (rows, columns) a worksheet declares in its <dimension>
+    element, which precedes the cell data, or None if it declares none.
+    """
+    with zf.open(path) as src:
+        head = src.read(SHEET_HEAD_BYTES)
+    m = _RE_DIMENSION.search(head)
+    if m is None:
+        return None
+    return _cell_ref(m.group(1).decode('ascii').rpartition(':')[2])
+
+
+def _xlsx_merged_ranges(source, sheet_name):
+    """
+    Return a sheet's merged ranges as 1-based inclusive (min_row, min_col,
+    max_row, max_col) tuples, read from its <mergeCell> elements.
+    """
+    ranges = []
+    with zipfile.ZipFile(source) as zf:
+        path = _xlsx_sheet_paths(zf).get(sheet_name)
+        if path is None:
+            return ranges
+        with zf.open(path) as src:
+            for _, el in ElementTree.iterparse(src):
+                if el.tag.endswith('}mergeCell'):
+                    first, _, last = el.get('ref', '').partition(':')
+                    min_row, min_col = _cell_ref(first)
+                    max_row, max_col = _cell_ref(last or first)
+                    ranges.append((min_row, min_col, max_row, max_col))
+                el.clear()
+    return ranges
+
+
+def _cell_ref(ref):
+    """Convert an A1-style reference like 'B12' to (row, column), 1-based."""
+    m = _RE_CELL_REF.match(ref)
+    if m is None:
+        raise ValueError(f"Invalid cell reference: {ref!r}")
+    col = 0
+    for ch in m.group(1).upper():
+        col = col * 26 + ord(ch) - 64
+    return int(m.group(2)), col
+
+
+def _calamine_rows(sheet):
+    """
+    Yield a calamine sheet's rows lazily, padded from A1 the way
+    to_python(skip_empty_area=False) returns them.
+    """
+    (start_row, start_col), (_, end_col) = sheet.start, sheet.end
+    blank = [''] * (end_col + 1)
+    for _ in range(start_row):
+        yield blank
+    lead = [''] * start_col
+    for row in sheet.iter_rows():
+        yield lead + row
+
+
+def _calamine_cell(val):
+    """Map a python-calamine cell value to the value openpyxl would give."""
+    if val == '':
+        return None
+    if type(val) is float and val.is_integer() and abs(val) < 1e15:
+        return int(val)  # openpyxl returns ints for whole numbers
+    if type(val) is datetime.date:
+        return datetime.datetime.combine(val, datetime.time())
+    return val
+
+
+def _fill_merged(rows, ranges):
+    """
+    Spread each merged range's top-left value across the range.
+    ranges yields 1-based inclusive (min_row, min_col, max_row, max_col).
+    Rows are grown to cover every range (within MAX_ROWS / MAX_COLS), as
+    openpyxl's already are.
+    """
+    ranges = list(ranges)
+    if not ranges:
+        return
+    n_cols = max(len(rows[0]) if rows else 0,
+                 min(max(r[3] for r in ranges), MAX_COLS))
+    for i, row in enumerate(rows):
+        if len(row) < n_cols:
+            rows[i] = row + [None] * (n_cols - len(row))
+    for _ in range(len(rows), min(max(r[2] for r in ranges), MAX_ROWS)):
+        rows.append([None] * n_cols)
+    n_rows = len(rows)
+    for min_row, min_col, max_row, max_col in ranges:
+        if min_row > n_rows or min_col > n_cols:
+            continue
+        # Get the value from the top-left cell
+        val = rows[min_row - 1][min_col - 1]
+        max_row = min(max_row, n_rows)
+        max_col = min(max_col, n_cols)
+        fill = [val] * (max_col - min_col + 1)
+        for r in range(min_row - 1, max_row):
+            rows[r][min_col - 1:max_col] = fill
 
 
 def _pick_best_sheet(wb):
     """
-    Auto-select the best sheet in a multi-sheet workbook.
-    Scores each sheet by how much it looks like a RACI matrix.
+    Auto-select the best sheet in a multi-sheet openpyxl workbook.
     Falls back to active sheet if no clear winner.
     """
     if len(wb.sheetnames) == 1:
         return wb.active
 
+    def sample(name):
+        # Read-only sheets stop parsing once past max_row
+        return wb[name].iter_rows(values_only=True,
+                                  max_row=SHEET_SAMPLE_ROWS,
+                                  max_col=SHEET_SAMPLE_COLS)
+
+    return wb[_best_sheet_name(wb.sheetnames, sample, wb.active.title)]
+
+
+def _best_sheet_name(names, sample_rows, default):
+    """
+    Score each sheet by how much it looks like a RACI matrix and return the
+    best sheet's name, or default if none scores above -1.
+    sample_rows(name) returns an iterable of the sheet's rows; it is only
+    called for sheets that can still beat the best score so far.
+    """
     best_score = -1
-    best_ws = wb.active
+    best_name = default
 
-    for name in wb.sheetnames:
-        ws = wb[name]
+    for name in names:
         score = 0
         name_lower = name.lower()
 
@@ -378,18 +731,27 @@ def _pick_best_sheet(wb):
         if any(kw in name_lower for kw in ['chart', 'graph', 'pivot', 'lookup', 'config', 'template', 'instruction', 'readme', 'cover']):
             score -= 50
 
-        # Sample data for RACI content
+        # RACI density adds at most 100, so a sheet that can't beat the
+        # current best on its name alone is not worth sampling
+        if score + 100 <= best_score:
+            continue
+
+        # Sample data for RACI content from the top-left corner only
         raci_count = 0
         cell_count = 0
-        for ri, row in enumerate(ws.iter_rows(values_only=True)):
-            if ri > 30:
+        for row in itertools.islice(sample_rows(name), SHEET_SAMPLE_ROWS):
+            for val in row[:SHEET_SAMPLE_COLS]:
+                if val is None:
+                    continue
+                if isinstance(val, str):
+                    val = val.strip().upper()
+                    if not val:
+                        continue
+                    if val in RACI_VALUES:
+                        raci_count += 1
+                cell_count += 1
+            if cell_count >= SHEET_SAMPLE_CELLS:
                 break
-            for val in row:
-                s = _cell_str(val).upper()
-                if s:
-                    cell_count += 1
-                if s in RACI_VALUES:
-                    raci_count += 1
 
         if cell_count > 0:
             raci_density = raci_count / cell_count
@@ -397,57 +759,97 @@ def _pick_best_sheet(wb):
 
         if score > best_score:
             best_score = score
-            best_ws = ws
+            best_name = name
 
-    return best_ws
+    return best_name
 
 
 def _load_csv(filepath):
     """Load a CSV file with auto-encoding detection."""
+    with open(filepath, 'rb') as f:
+        return _load_csv_bytes(f.read())
+
+
+def _load_csv_bytes(raw):
+    """
+    Parse CSV bytes with auto-encoding detection.
+    The bytes are read once and each candidate encoding decodes them in memory.
+    """
     # Try encodings in order of likelihood
     for encoding in ['utf-8-sig', 'utf-8', 'cp1252', 'latin-1', 'iso-8859-1']:
         try:
-            rows = []
-            with open(filepath, 'r', encoding=encoding) as f:
-                # Sniff delimiter
-                sample = f.read(4096)
-                f.seek(0)
-                try:
-                    dialect = csv.Sniffer().sniff(sample, delimiters=',;\t|')
-                except csv.Error:
-                    dialect = csv.excel
-                reader = csv.reader(f, dialect)
-                for row in reader:
-                    rows.append(row)
-            if rows:
-                return rows, 'CSV'
+            text = raw.decode(encoding)
         except (UnicodeDecodeError, UnicodeError):
             continue
+        # newline=None gives the same universal-newline handling as open()
+        f = io.StringIO(text, newline=None)
+        # Sniff delimiter
+        sample = f.read(4096)
+        f.seek(0)
+        try:
+            dialect = csv.Sniffer().sniff(sample, delimiters=',;\t|')
+        except csv.Error:
+            dialect = csv.excel
+        rows = _capped_rows(csv.reader(f, dialect))
+        if rows:
+            return rows, 'CSV'
     raise ValueError("Could not read CSV file with any supported encoding")
 
 
+def _capped_rows(row_iter, convert=None):
+    """
+    Read at most MAX_ROWS rows of at most MAX_COLS cells from row_iter,
+    mapping each cell through convert. Past either limit cells are only
+    checked for content (formatting alone can stretch a sheet's extent):
+    any value there raises ValueError, and nothing more is stored.
+    """
+    rows = []
+    for row in itertools.islice(row_iter, MAX_ROWS):
+        if len(row) > MAX_COLS:
+            if _has_value(row[MAX_COLS:]):
+                raise ValueError(f"Sheet too large: more than {MAX_COLS} columns")
+            row = row[:MAX_COLS]
+        rows.append(list(row) if convert is None else [convert(v) for v in row])
+    for row in row_iter:
+        if _has_value(row):
+            raise ValueError(f"Sheet too large: more than {MAX_ROWS:,} rows")
+    return rows
+
+
+def _has_value(cells):
+    return any(c is not None and str(c).strip() for c in cells)
+
+
 def _find_header_row(rows, max_scan=25):
     """
     Find the header row: first row with 4+ DISTINCT non-empty cells.
     Skips merged title rows where all cells have the same value.
     Also skips rows that look like metadata (date, author, version, etc.)
     """
+    # One pass: return the first strict match, remembering the first relaxed
+    # and first non-empty rows as fallbacks
+    relaxed = None
+    first_content = None
     for i, row in enumerate(rows[:max_scan]):
-        non_empty = [_cell_str(c) for c in row if _cell_str(c) != '']
-        if len(non_empty) >= 4 and len(set(non_empty)) >= 3:
+        non_empty = [v for v in (str(c).strip() for c in row if c is not None) if v]
+        if not non_empty:
+            continue
+        distinct = len(set(non_empty))
+        if len(non_empty) >= 4 and distinct >= 3:
             # Extra check: skip rows where values are mostly numeric (data, not headers)
-            numeric_count = sum(1 for v in non_empty if re.match(r'^[\d.,%]+$', v))
+            numeric_count = sum(1 for v in non_empty if _RE_NUMERIC.match(v))
             if numeric_count / len(non_empty) < 0.6:
                 return i
-    # Fallback: first row with 3+ distinct non-empty cells
-    for i, row in enumerate(rows[:max_scan]):
-        non_empty = [_cell_str(c) for c in row if _cell_str(c) != '']
-        if len(non_empty) >= 3 and len(set(non_empty)) >= 2:
-            return i
-    # Last resort: first row with any content
-    for i, row in enumerate(rows[:max_scan]):
-        if any(_cell_str(c) != '' for c in row):
-            return i
+        # Fallback: first row with 3+ distinct non-empty cells
+        if relaxed is None and len(non_empty) >= 3 and distinct >= 2:
+            relaxed = i
+        # Last resort: first row with any content
+        if first_content is None:
+            first_content = i
+    if relaxed is not None:
+        return relaxed
+    if first_content is not None:
+        return first_content
     return 0
 
 
@@ -462,7 +864,7 @@ def _skip_subheader_rows(rows, header_idx):
     subheader_rows = []
     for i in range(header_idx + 1, min(header_idx + 5, len(rows))):
         row = rows[i]
-        non_empty = [c for c in row if _cell_str(c) != '']
+        non_empty = [c for c in row if c is not None and str(c).strip()]
         if len(non_empty) < 3:
             break  # Not a sub-header row
         has_raci = any(_is_raci(c) for c in row)
@@ -474,6 +876,62 @@ def _skip_subheader_rows(rows, header_idx):
     return skip_count, subheader_rows
 
 
+def _column_stats(values):
+    """
+    Summarize a column's non-empty (stripped) values in one pass.
+    Returns (raci_pct, letter_pct, mat_pct, numeric_pct, unique_ratio, avg_len),
+    or None for an empty column.
+    """
+    total = len(values)
+    if total == 0:
+        return None
+    raci_count = 0      # values that normalize to RACI
+    mat_count = 0       # numbers in a valid maturity range
+    numeric_count = 0   # purely numeric (IDs, sequence numbers)
+    letter_count = 0    # short values, as RACI letters are
+    total_len = 0
+    uniques = set()
+    # Values are already stripped and non-empty, so the cached helpers can be
+    # called directly (after the RACI length check _normalize_raci makes)
+    for v in values:
+        if len(v) <= RACI_MAX_LEN and _normalize_raci_str(v):
+            raci_count += 1
+        if _is_maturity_str(v, 100):
+            mat_count += 1
+        if _RE_INT_FLOAT.match(v):
+            numeric_count += 1
+        n = len(v)
+        total_len += n
+        if n <= 3:
+            letter_count += 1
+        uniques.add(v.lower())
+    return (
+        raci_count / total,
+        letter_count / total,
+        mat_count / total,
+        numeric_count / total,
+        len(uniques) / total,  # repeating values suggest a category
+        total_len / total,     # long text suggests a description
+    )
+
+
+def _stats_ambiguous(stats):
+    """
+    Check whether any column statistic sits within SAMPLE_MARGIN of a
+    threshold used by _classify_columns, so the unsampled rows could tip it.
+    """
+    raci_pct, letter_pct, mat_pct, numeric_pct, unique_ratio, avg_len = stats
+    checks = (
+        (raci_pct, 0.3), (letter_pct, 0.3), (mat_pct, 0.4),
+        (numeric_pct, 0.4), (numeric_pct, 0.5), (numeric_pct, 0.8),
+        (unique_ratio, 0.3), (unique_ratio, 0.5), (unique_ratio, 0.7),
+    )
+    if any(abs(v - t) < SAMPLE_MARGIN for v, t in checks):
+        return True
+    # Average length thresholds (name > 3 chars, description > 30 chars)
+    return abs(avg_len - 3) < 1 or abs(avg_len - 30) < 5
+
+
 def _classify_columns(headers, data_rows):
     """
     Classify each column by inspecting header text and data values.
@@ -481,16 +939,16 @@ def _classify_columns(headers, data_rows):
     """
     num_cols = len(headers)
     classifications = {}
-    # Collect data stats per column
-    col_stats = {}
-    for ci in range(num_cols):
-        values = []
-        for row in data_rows:
-            if ci < len(row):
-                v = _cell_str(row[ci])
+    # Collect non-empty values per column in a single pass over the first
+    # SAMPLE_ROWS rows; ambiguous columns are extended to the full sheet below
+    col_stats = [[] for _ in range(num_cols)]
+    sampled = len(data_rows) > SAMPLE_ROWS
+    for row in data_rows[:SAMPLE_ROWS]:
+        for ci, v in enumerate(row[:num_cols]):
+            if v is not None:
+                v = str(v).strip()
                 if v:
-                    values.append(v)
-        col_stats[ci] = values
+                    col_stats[ci].append(v)
 
     # First pass: classify by header keywords
     header_lower = [_cell_str(h).lower() for h in headers]
@@ -498,37 +956,18 @@ def _classify_columns(headers, data_rows):
     for ci, hl in enumerate(header_lower):
         if not hl:
             continue
-        # Check delta/skip first (to exclude before maturity checks)
-        for kw in HEADER_KEYWORDS['delta']:
-            if kw.lower() in hl:
-                classifications[ci] = 'delta'
-                break
-        if ci in classifications:
-            continue
-        # Check status
-        for kw in HEADER_KEYWORDS['status']:
-            if kw in hl:
-                classifications[ci] = 'status'
-                break
-        if ci in classifications:
-            continue
-        # Check priority (skip these columns, not useful for RACI)
-        for kw in HEADER_KEYWORDS['priority']:
-            if kw in hl:
-                classifications[ci] = 'priority'
-                break
-        if ci in classifications:
-            continue
+        # Check delta/skip first (to exclude before maturity checks),
+        # then status and priority (skip these, not useful for RACI)
+        if _HEADER_KW_RE['delta'].search(hl):
+            classifications[ci] = 'delta'
+        elif _HEADER_KW_RE['status'].search(hl):
+            classifications[ci] = 'status'
+        elif _HEADER_KW_RE['priority'].search(hl):
+            classifications[ci] = 'priority'
         # Check ID columns (skip these) — use exact/prefix match to avoid
         # false positives like 'no' matching 'now'
-        if hl in ('#', 'id', 'no', 'no.', 'ref', 'ref.', 'key'):
+        elif _RE_ID_HEADER.match(hl):
             classifications[ci] = 'id'
-            continue
-        for kw in HEADER_KEYWORDS['id']:
-            # Require exact match, or keyword followed by non-alpha (e.g., "ref #")
-            if hl == kw or re.match(rf'^{re.escape(kw)}[\s._#\-]+', hl) or re.match(rf'^[\s._#\-]+{re.escape(kw)}$', hl):
-                classifications[ci] = 'id'
-                break
 
     # Second pass: classify by data patterns for unclassified columns
     name_col_found = False
@@ -537,37 +976,28 @@ def _classify_columns(headers, data_rows):
         if ci in classifications:
             continue
         hl = header_lower[ci]
-        values = col_stats.get(ci, [])
-        total = len(values)
-        if total == 0:
+        values = col_stats[ci]
+        stats = _column_stats(values)
+        if sampled and (stats is None or _stats_ambiguous(stats)):
+            # Too close to a threshold to trust the sample: use the whole column
+            values = values + [
+                v for v in (str(row[ci]).strip() for row in data_rows[SAMPLE_ROWS:]
+                            if ci < len(row) and row[ci] is not None)
+                if v
+            ]
+            stats = _column_stats(values)
+        if stats is None:
             classifications[ci] = 'empty'
             continue
-
-        # Check RACI pattern: count values that normalize to RACI
-        raci_count = sum(1 for v in values if _normalize_raci(v) != '')
-        raci_pct = raci_count / total if total > 0 else 0
-
-        # Check maturity pattern: >40% are numbers in valid range
-        mat_count = sum(1 for v in values if _is_maturity_number(v, 100))
-        mat_pct = mat_count / total if total > 0 else 0
-
-        # Check if it's a text column with repeating values (category)
-        unique_ratio = len(set(v.lower() for v in values)) / total if total > 0 else 1
-
-        # Check description (long text)
-        avg_len = sum(len(v) for v in values) / total if total > 0 else 0
-
-        # Check if column is purely numeric (IDs, sequence numbers)
-        numeric_count = sum(1 for v in values if re.match(r'^[\d]+\.?[\d]*$', v))
-        numeric_pct = numeric_count / total if total > 0 else 0
+        total = len(values)
+        raci_pct, letter_pct, mat_pct, numeric_pct, unique_ratio, avg_len = stats
 
         # RACI detection: either high RACI percentage or header suggests roles
         if raci_pct > 0.3:
             # But avoid misclassifying numeric columns with values 1-5
             # that happen to overlap with maturity. RACI columns should have
             # mostly single letters.
-            letter_count = sum(1 for v in values if len(v.strip()) <= 3)
-            if letter_count / total > 0.3:
+            if letter_pct > 0.3:
                 classifications[ci] = 'raci'
                 continue
 
@@ -575,18 +1005,18 @@ def _classify_columns(headers, data_rows):
             # Detect the scale for this column
             scale_max, _ = _detect_maturity_scale(values)
             # Distinguish now vs target by header keywords
-            is_target = any(kw in hl for kw in TARGET_KEYWORDS)
+            is_target = _RE_TARGET.search(hl) is not None
             existing_mat = [c for c, t in classifications.items() if t == 'maturity_now']
             if is_target or existing_mat:
                 classifications[ci] = 'maturity_target'
             else:
                 classifications[ci] = 'maturity_now'
-        elif any(kw in hl for kw in HEADER_KEYWORDS['description']):
+        elif _HEADER_KW_RE['description'].search(hl):
             classifications[ci] = 'description'
             desc_col_found = True
-        elif any(kw in hl for kw in HEADER_KEYWORDS['category']):
+        elif _HEADER_KW_RE['category'].search(hl):
             classifications[ci] = 'category'
-        elif any(kw in hl for kw in HEADER_KEYWORDS['name']):
+        elif _HEADER_KW_RE['name'].search(hl):
             classifications[ci] = 'name'
             name_col_found = True
         elif not name_col_found and avg_len > 3 and unique_ratio > 0.5 and numeric_pct < 0.5:
@@ -652,8 +1082,8 @@ def _detect_transposed(rows, header_idx, classifications):
     raci_cells = 0
     for row in data_rows[:20]:
         for ci in range(1, min(len(row), len(headers))):
-            v = _cell_str(row[ci])
-            if v:
+            v = row[ci]
+            if v is not None and str(v).strip():
                 total_cells += 1
                 if _normalize_raci(v):
                     raci_cells += 1
@@ -674,9 +1104,11 @@ def _parse_transposed(rows, header_idx):
     headers = rows[header_idx]
     data_rows = rows[header_idx + 1:]
 
-    # First column is role names, rest are capabilities
+    # First column is role names, rest are capabilities (named columns only)
+    cap_cols = [(ci, name) for ci, name in enumerate(_cell_raw(h) for h in headers)
+                if ci >= 1 and name]
     roles = []
-    role_items = {}  # role_index -> {cap_name: raci_val}
+    role_items = defaultdict(dict)  # cap_name -> {role_id: raci_val}
 
     for i, row in enumerate(data_rows):
         if not row:
@@ -699,14 +1131,12 @@ def _parse_transposed(rows, header_idx):
             'status': 'unfilled' if is_unfilled else 'filled',
         })
 
-        for ci in range(1, len(row)):
-            cap_name = _cell_raw(headers[ci]) if ci < len(headers) else ''
-            if not cap_name:
-                continue
+        n = len(row)
+        for ci, cap_name in cap_cols:
+            if ci >= n:
+                break
             val = _normalize_raci(row[ci])
             if val:
-                if cap_name not in role_items:
-                    role_items[cap_name] = {}
                 role_items[cap_name][role_id] = val
 
     # Build categories (single "General" category for transposed)
@@ -745,21 +1175,181 @@ def _parse_transposed(rows, header_idx):
     return {'roles': roles, 'categories': categories, 'meta': meta}
 
 
+def _build_categories(data_rows, role_cols, raci_cols, name_col, cat_col, desc_col,
+                      mat_now_vals, mat_tgt_vals, mat_scale):
+    """
+    Turn data rows into items grouped by category, in sheet order.
+    Inline category header rows switch the current category for the rows
+    that follow, so rows must be walked in order.
+    Rows are padded to the header width, so column indices need no bounds
+    checks. role_cols lists (role id, column index) pairs in role order.
+    mat_now_vals / mat_tgt_vals are the parsed maturity columns (floats or
+    None per data row), or None when the sheet has no such column.
+    Returns a dict: category name -> {'items': [...], 'has_raci': bool,
+    'orphaned': [names of items with no R], 'r_counts': {role id: R count}}.
+    """
+    categories_dict = {}  # name -> {color, items}
+    current_category = 'General'
+
+    # Loop-invariant lookups, bound once outside the per-row loop
+    cell_raw = _cell_raw
+    normalize_raci = _normalize_raci
+    scale_maturity = _scale_maturity
+    summary_search = _RE_SUMMARY_ROW.search  # _is_summary_row, inlined below
+    raci_col_list = list(raci_cols)
+
+    for ri, row in enumerate(data_rows):
+        # Skip completely empty rows
+        if not any(c is not None and str(c).strip() for c in row):
+            continue
+
+        name_val = cell_raw(row[name_col]) if name_col is not None else ''
+
+        # Check if this is a category header row (inline category detection):
+        # Name column has a value but ALL RACI columns are empty.
+        # Must run BEFORE summary skip so that "CATEGORY AVERAGES" etc.
+        # become their own category (filtered later by has_any_raci).
+        all_raci_empty = True
+        for ci in raci_col_list:
+            v = row[ci]
+            if v is not None and str(v).strip():
+                all_raci_empty = False
+                break
+
+        if name_val and all_raci_empty and not cat_col:
+            # This is an inline category header
+            current_category = _strip_category_numbering(name_val)
+            continue
+
+        # Skip rows with no name, and summary/aggregate rows (after
+        # category detection)
+        if not name_val or summary_search(name_val.lower()) is not None:
+            continue
+
+        # Determine category
+        if cat_col is not None:
+            cat_val = cell_raw(row[cat_col])
+            if cat_val:
+                current_category = _strip_category_numbering(cat_val)
+
+        # Build item
+        item = {'name': name_val}
+
+        if desc_col is not None:
+            desc_val = cell_raw(row[desc_col])
+            if desc_val:
+                item['desc'] = desc_val
+
+        # RACI assignments — use _normalize_raci for extended format support.
+        # Roles holding an R are tracked as we go (a later column with the
+        # same role id overwrites an earlier one, so drop it again then).
+        has_raci = False
+        r_rids = set()
+        for rid, ci in role_cols:
+            v = row[ci]
+            if v is None or v == '':
+                continue  # blank cell, nothing to normalize
+            val = normalize_raci(v)
+            if val:
+                item[rid] = val
+                has_raci = True
+                if val == 'R':
+                    r_rids.add(rid)
+                elif r_rids:
+                    r_rids.discard(rid)
+
+        # Maturity (normalized to 0-5)
+        if mat_now_vals is not None and mat_now_vals[ri] is not None:
+            item['now'] = scale_maturity(mat_now_vals[ri], mat_scale)
+        if mat_tgt_vals is not None and mat_tgt_vals[ri] is not None:
+            item['tgt'] = scale_maturity(mat_tgt_vals[ri], mat_scale)
+
+        # Add to category, along with its validation tallies
+        cat_entry = categories_dict.get(current_category)
+        if cat_entry is None:
+            cat_entry = categories_dict[current_category] = {
+                'items': [], 'has_raci': False, 'orphaned': [], 'r_counts': {},
+            }
+        cat_entry['items'].append(item)
+        if has_raci:
+            cat_entry['has_raci'] = True
+        if r_rids:
+            cat_r = cat_entry['r_counts']
+            for rid in r_rids:
+                cat_r[rid] = cat_r.get(rid, 0) + 1
+        else:
+            cat_entry['orphaned'].append(name_val)
+
+    return categories_dict
+
+
 def parse_file(filepath, sheet_name=None):
     """
     Parse a RACI spreadsheet and return structured data.
 
+    Results are cached per (real path, mtime, size, sheet), so re-parsing
+    an unchanged file returns a fresh copy of the earlier result.
+
     Returns:
         dict with 'roles', 'categories', 'meta'
     """
-    ext = os.path.splitext(filepath)[1].lower()
+    st = os.stat(filepath)
+    key = (os.path.realpath(filepath), st.st_mtime_ns, st.st_size, sheet_name)
+    with _PARSE_CACHE_LOCK:
+        cached = _PARSE_CACHE.get(key)
+        if cached is not None:
+            _PARSE_CACHE.move_to_end(key)
+    if cached is None:
+        cached = _parse_path(filepath, sheet_name)
+        with _PARSE_CACHE_LOCK:
+            _PARSE_CACHE[key] = cached
+            while len(_PARSE_CACHE) > PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+    # Callers are free to mutate the result (the server edits it in place)
+    result = _copy_result(cached)
+    result['meta']['filename'] = os.path.basename(filepath)
+    return result
+
+
+def _copy_result(data):
+    """
+    Copy a parse result deeply enough for callers to mutate it. Roles and
+    items are flat dicts of scalars, so they only need shallow copies; this
+    is several times faster than copy.deepcopy on large sheets.
+    """
+    return {
+        'roles': [dict(r) for r in data['roles']],
+        'categories': [
+            dict(cat, items=[dict(item) for item in cat['items']])
+            for cat in data['categories']
+        ],
+        'meta': copy.deepcopy(data['meta']),
+    }
+
+
+def _parse_path(filepath, sheet_name=None):
+    """Parse a RACI spreadsheet from disk without consulting the cache."""
+    rows, sheet_used = _load_rows(filepath, filepath, sheet_name)
+    return _parse_rows(rows, sheet_used, filepath)
+
+
+def _load_rows(source, filename, sheet_name=None):
+    """
+    Load the raw rows of a spreadsheet. source is a path or a seekable
+    binary file object; filename picks the reader by its extension.
+    """
+    ext = os.path.splitext(filename)[1].lower()
     if ext == '.csv':
-        rows, sheet_used = _load_csv(filepath)
-    elif ext in ('.xlsx', '.xls'):
-        rows, sheet_used = _load_xlsx(filepath, sheet_name)
-    else:
-        raise ValueError(f"Unsupported file format: {ext}. Use .xlsx or .csv")
+        if isinstance(source, (str, os.PathLike)):
+            return _load_csv(source)
+        return _load_csv_bytes(source.read())
+    if ext in XLSX_EXTENSIONS:
+        return _load_xlsx(source, sheet_name)
+    raise ValueError(f"Unsupported file format: {ext}. Use .xlsx or .csv")
 
+
+def _parse_rows(rows, sheet_used, filename):
+    """Turn loaded rows into roles, categories and meta."""
     if not rows:
         raise ValueError("File is empty or unreadable")
 
@@ -784,12 +1374,18 @@ def parse_file(filepath, sheet_name=None):
     # Step 3.5: Check for transposed layout
     if _detect_transposed(rows, header_idx, classifications):
         result = _parse_transposed(rows, header_idx)
-        result['meta']['filename'] = os.path.basename(filepath)
+        result['meta']['filename'] = os.path.basename(filename)
         result['meta']['sheet'] = sheet_used
+        result['meta']['limits'] = {'rows': MAX_ROWS, 'cols': MAX_COLS}
         return result
 
     # Step 4: Extract role info from RACI columns
-    raci_cols = {ci: _cell_raw(headers[ci]) for ci, t in classifications.items() if t == 'raci'}
+    # Column indices per classification, in classification order
+    by_type = {}
+    for ci, t in classifications.items():
+        by_type.setdefault(t, []).append(ci)
+
+    raci_cols = {ci: _cell_raw(headers[ci]) for ci in by_type.get('raci', ())}
     if not raci_cols:
         raise ValueError(
             "No RACI columns detected. Ensure your spreadsheet has columns "
@@ -811,6 +1407,7 @@ def parse_file(filepath, sheet_name=None):
                     subheader_labels[ci] = val
 
     roles = []
+    role_cols = []  # (role id, column index), kept out of the returned roles
     for i, (ci, label) in enumerate(sorted(raci_cols.items())):
         # Prefer sub-header full name for display, but keep short header as 'short'
         full_label = subheader_labels.get(ci, label)
@@ -827,140 +1424,67 @@ def parse_file(filepath, sheet_name=None):
             'short': short_code,
             'color': ROLE_PALETTE[i % len(ROLE_PALETTE)],
             'status': 'unfilled' if is_unfilled else 'filled',
-            'col_index': ci,
         })
+        role_cols.append((role_id, ci))
 
     # Step 5: Find name, category, description, maturity columns
-    name_col = next((ci for ci, t in classifications.items() if t == 'name'), None)
-    cat_col = next((ci for ci, t in classifications.items() if t == 'category'), None)
-    desc_col = next((ci for ci, t in classifications.items() if t == 'description'), None)
-    mat_now_col = next((ci for ci, t in classifications.items() if t == 'maturity_now'), None)
-    mat_tgt_col = next((ci for ci, t in classifications.items() if t == 'maturity_target'), None)
+    name_col = by_type.get('name', [None])[0]
+    cat_col = by_type.get('category', [None])[0]
+    desc_col = by_type.get('description', [None])[0]
+    mat_now_col = by_type.get('maturity_now', [None])[0]
+    mat_tgt_col = by_type.get('maturity_target', [None])[0]
+
+    # Parse maturity columns once (rows are padded to the header width);
+    # scale detection and the per-item scores both use these numbers
+    mat_now_vals = None
+    mat_tgt_vals = None
+    if mat_now_col is not None:
+        mat_now_vals = [_to_float(row[mat_now_col]) for row in data_rows]
+    if mat_tgt_col is not None:
+        mat_tgt_vals = [_to_float(row[mat_tgt_col]) for row in data_rows]
 
     # Detect maturity scale from data
     mat_scale = 5
-    if mat_now_col is not None:
-        mat_values = [_cell_str(row[mat_now_col]) for row in data_rows
-                      if mat_now_col < len(row) and _cell_str(row[mat_now_col])]
-        if mat_tgt_col is not None:
-            mat_values += [_cell_str(row[mat_tgt_col]) for row in data_rows
-                           if mat_tgt_col < len(row) and _cell_str(row[mat_tgt_col])]
-        mat_scale, _ = _detect_maturity_scale(mat_values)
+    if mat_now_vals is not None:
+        mat_nums = [n for n in mat_now_vals if n is not None]
+        if mat_tgt_vals is not None:
+            mat_nums += [n for n in mat_tgt_vals if n is not None]
+        mat_scale, _ = _detect_maturity_scale(mat_nums)
 
     # Step 6: Build categories and items
-    categories_dict = {}  # name -> {color, items}
-    current_category = 'General'
-
-    for row in data_rows:
-        # Skip completely empty rows
-        non_empty = [c for c in row if _cell_str(c) != '']
-        if not non_empty:
-            continue
-
-        name_val = _cell_raw(row[name_col]) if name_col is not None and name_col < len(row) else ''
-
-        # Check if this is a category header row (inline category detection):
-        # Name column has a value but ALL RACI columns are empty.
-        # Must run BEFORE summary skip so that "CATEGORY AVERAGES" etc.
-        # become their own category (filtered later by has_any_raci).
-        raci_values_in_row = [_cell_str(row[ci]) for ci in raci_cols.keys() if ci < len(row)]
-        all_raci_empty = all(v == '' for v in raci_values_in_row)
+    categories_dict = _build_categories(
+        data_rows, role_cols, raci_cols, name_col, cat_col, desc_col,
+        mat_now_vals, mat_tgt_vals, mat_scale,
+    )
 
-        if name_val and all_raci_empty and not cat_col:
-            # This is an inline category header
-            current_category = _strip_category_numbering(name_val)
-            continue
-
-        # Skip summary/aggregate rows (after category detection)
-        if name_val and _is_summary_row(name_val):
-            continue
-
-        # Skip rows with no name
-        if not name_val:
-            continue
-
-        # Determine category
-        if cat_col is not None and cat_col < len(row):
-            cat_val = _cell_raw(row[cat_col])
-            if cat_val:
-                current_category = _strip_category_numbering(cat_val)
-
-        # Build item
-        item = {'name': name_val}
-
-        if desc_col is not None and desc_col < len(row):
-            desc_val = _cell_raw(row[desc_col])
-            if desc_val:
-                item['desc'] = desc_val
-
-        # RACI assignments — use _normalize_raci for extended format support
-        for role in roles:
-            ci = role['col_index']
-            if ci < len(row):
-                val = _normalize_raci(row[ci])
-                if val:
-                    item[role['id']] = val
-
-        # Maturity (normalized to 0-5)
-        if mat_now_col is not None and mat_now_col < len(row):
-            normalized = _normalize_maturity(row[mat_now_col], mat_scale)
-            if normalized is not None:
-                item['now'] = normalized
-        if mat_tgt_col is not None and mat_tgt_col < len(row):
-            normalized = _normalize_maturity(row[mat_tgt_col], mat_scale)
-            if normalized is not None:
-                item['tgt'] = normalized
-
-        # Add to category
-        if current_category not in categories_dict:
-            categories_dict[current_category] = {'items': []}
-        categories_dict[current_category]['items'].append(item)
-
-    # Assign category colors (skip summary/footer sections)
-    role_ids = [r['id'] for r in roles]
+    # Assign category colors (skip summary/footer sections), totalling the
+    # validation tallies of the categories that are kept
     categories = []
     color_idx = 0
+    r_counts = {r['id']: 0 for r in roles}
+    orphaned = []
     for cat_name, cat_data in categories_dict.items():
         if not cat_data['items']:
             continue
         # Skip categories whose names indicate summary/footer content
         if _is_summary_category(cat_name):
             continue
-        # Check if at least one item in this category has a RACI value
-        has_any_raci = any(
-            any(item.get(rid) in RACI_VALUES for rid in role_ids)
-            for item in cat_data['items']
-        )
-        if not has_any_raci:
-            continue  # Skip summary/aggregate sections
+        # Skip summary/aggregate sections: no item has a RACI value
+        if not cat_data['has_raci']:
+            continue
         categories.append({
             'name': cat_name,
             'color': CATEGORY_PALETTE[color_idx % len(CATEGORY_PALETTE)],
             'items': cat_data['items'],
         })
         color_idx += 1
-
-    # Remove col_index from roles (internal use only)
-    for role in roles:
-        del role['col_index']
+        orphaned.extend(f"{cat_name} > {name}" for name in cat_data['orphaned'])
+        for rid, n in cat_data['r_counts'].items():
+            r_counts[rid] += n
 
     # Build validation report
     total_capabilities = sum(len(c['items']) for c in categories)
-    orphaned = []
-    for cat in categories:
-        for item in cat['items']:
-            has_r = any(item.get(r['id']) == 'R' for r in roles)
-            if not has_r:
-                orphaned.append(f"{cat['name']} > {item['name']}")
-
-    zero_r_roles = []
-    for role in roles:
-        r_count = sum(
-            1 for cat in categories for item in cat['items']
-            if item.get(role['id']) == 'R'
-        )
-        if r_count == 0:
-            zero_r_roles.append(role['label'])
+    zero_r_roles = [r['label'] for r in roles if r_counts[r['id']] == 0]
 
     col_report = {
         ci: {'header': _cell_raw(headers[ci]) if ci < len(headers) else '',
@@ -970,7 +1494,7 @@ def parse_file(filepath, sheet_name=None):
     }
 
     meta = {
-        'filename': os.path.basename(filepath),
+        'filename': os.path.basename(filename),
         'sheet': sheet_used,
         'role_count': len(roles),
         'category_count': len(categories),
@@ -981,6 +1505,7 @@ def parse_file(filepath, sheet_name=None):
         'maturity_scale': mat_scale,
         'column_classifications': col_report,
         'layout': 'standard',
+        'limits': {'rows': MAX_ROWS, 'cols': MAX_COLS},
     }
 
     return {
@@ -991,13 +1516,25 @@ def parse_file(filepath, sheet_name=None):
 
 
 def parse_file_from_bytes(file_bytes, filename, sheet_name=None):
-    """Parse RACI data from in-memory bytes (for upload endpoint)."""
-    import tempfile
-    ext = os.path.splitext(filename)[1].lower()
-    with tempfile.NamedTemporaryFile(suffix=ext, delete=False) as tmp:
-        tmp.write(file_bytes)
-        tmp_path = tmp.name
-    try:
-        return parse_file(tmp_path, sheet_name)
-    finally:
-        os.unlink(tmp_path)
+    """Parse RACI data from in-memory bytes."""
+    return parse_file_from_stream(io.BytesIO(file_bytes), filename, sheet_name)
+
+
+def parse_file_from_stream(stream, filename, sheet_name=None):
+    """
+    Parse RACI data from a readable binary stream (for upload endpoint).
+    Seekable streams are handed straight to the readers with no disk
+    round-trip; others are first spooled (to memory, or disk if large).
+    Uploads are never re-read, so the parse cache is skipped.
+    """
+    seekable = getattr(stream, 'seekable', None)
+    if seekable is not None and seekable():
+        rows, sheet_used = _load_rows(stream, filename, sheet_name)
+    else:
+        import shutil
+        import tempfile
+        with tempfile.SpooledTemporaryFile(max_size=8 * 1024 * 1024) as spool:
+            shutil.copyfileobj(stream, spool)
+            spool.seek(0)
+            rows, sheet_used = _load_rows(spool, filename, sheet_name)
+    return _parse_rows(rows, sheet_used, os.path.basename(filename))
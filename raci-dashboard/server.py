@@ -2,27 +2,79 @@
 Flask server — serves the dashboard and handles file uploads and exports.
 """
 
-import io
-import json
+import hashlib
 import os
+import shutil
 import tempfile
+import threading
 import zipfile
 
 from flask import Flask, Response, request, send_from_directory, send_file
+from flask.json.provider import DefaultJSONProvider
 
-from parser import parse_file_from_bytes
+from export import export_html, export_powerbi
+from jsonutil import dumps_json, loads_json
+from parser import SUPPORTED_EXTENSIONS, parse_file_from_stream
 
 # Resolve paths
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 WEB_DIR = os.path.join(BASE_DIR, 'web')
 
+RACI_VALID = frozenset('RACI')
+
+
+class _JSONProvider(DefaultJSONProvider):
+    """Parses request bodies (request.get_json) with jsonutil.loads_json."""
+
+    def loads(self, s, **kwargs):
+        return loads_json(s)
+
 
 def create_app(initial_data=None):
     app = Flask(__name__, static_folder=WEB_DIR, static_url_path='')
+    app.json = _JSONProvider(app)
     app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50 MB max upload
 
-    # Store current data
-    app.raci_data = initial_data
+    # Store current data, plus its serialized JSON and ETag (built on first
+    # request after each change) and a (category, capability) -> item index
+    # for edits. The lock keeps edits and serialization consistent.
+    app._data_lock = threading.Lock()
+
+    def _set_data(data):
+        index = {}
+        for cat in (data or {}).get('categories', ()):
+            for item in cat['items']:
+                index.setdefault((cat['name'], item['name']), item)
+        with app._data_lock:
+            app.raci_data = data
+            app._raci_json = None
+            app._item_index = index
+
+    _set_data(initial_data)
+
+    def _find_item(cat_name, cap_name):
+        if not isinstance(cat_name, str) or not isinstance(cap_name, str):
+            return None
+        return app._item_index.get((cat_name, cap_name))
+
+    def _data_json():
+        with app._data_lock:
+            if app._raci_json is None:
+                app._raci_json = dumps_json(app.raci_data)
+                app._raci_etag = hashlib.blake2b(
+                    app._raci_json, digest_size=16).hexdigest()
+            return app._raci_json, app._raci_etag
+
+    def _data_response():
+        body, etag = _data_json()
+        if request.if_none_match.contains(etag):
+            resp = Response(status=304)
+        else:
+            resp = Response(body, mimetype='application/json')
+        resp.set_etag(etag)
+        # Let the browser keep a copy but revalidate it on every load
+        resp.headers['Cache-Control'] = 'no-cache'
+        return resp
 
     @app.route('/')
     def index():
@@ -31,148 +83,216 @@ def create_app(initial_data=None):
     @app.route('/api/data')
     def get_data():
         if app.raci_data is None:
-            return Response(
-                json.dumps({'error': 'No data loaded. Upload a file.'}),
-                status=404,
-                mimetype='application/json'
-            )
-        return Response(
-            json.dumps(app.raci_data, ensure_ascii=False),
-            mimetype='application/json'
-        )
+            return _json({'error': 'No data loaded. Upload a file.'}, 404)
+        return _data_response()
 
     @app.route('/api/upload', methods=['POST'])
     def upload():
+        # Refuse oversized bodies before the multipart form is parsed
+        max_length = app.config['MAX_CONTENT_LENGTH']
+        if request.content_length and request.content_length > max_length:
+            return _json({'error': f'File too large (max {max_length // (1024 * 1024)} MB)'}, 413)
         if 'file' not in request.files:
-            return Response(
-                json.dumps({'error': 'No file provided'}),
-                status=400,
-                mimetype='application/json'
-            )
+            return _json({'error': 'No file provided'}, 400)
         f = request.files['file']
         if not f.filename:
-            return Response(
-                json.dumps({'error': 'No file selected'}),
-                status=400,
-                mimetype='application/json'
-            )
+            return _json({'error': 'No file selected'}, 400)
+        ext = os.path.splitext(f.filename)[1].lower()
+        if ext not in SUPPORTED_EXTENSIONS:
+            return _json({'error': f"Unsupported file format: {ext or 'none'}. "
+                                   f"Use {', '.join(SUPPORTED_EXTENSIONS)}"}, 415)
         sheet = request.form.get('sheet')
         try:
-            data = parse_file_from_bytes(
-                f.read(), f.filename, sheet_name=sheet or None
-            )
-            app.raci_data = data
-            return Response(
-                json.dumps(data, ensure_ascii=False),
-                mimetype='application/json'
+            data = parse_file_from_stream(
+                f, f.filename, sheet_name=sheet or None
             )
+            _set_data(data)
+            body, _ = _data_json()
+            return Response(body, mimetype='application/json')
         except ValueError as e:
-            return Response(
-                json.dumps({'error': str(e)}),
-                status=422,
-                mimetype='application/json'
-            )
+            return _json({'error': str(e)}, 422)
         except Exception as e:
-            return Response(
-                json.dumps({'error': f'Failed to parse file: {e}'}),
-                status=500,
-                mimetype='application/json'
-            )
+            return _json({'error': f'Failed to parse file: {e}'}, 500)
 
     @app.route('/api/export/html', methods=['POST'])
     def export_html_endpoint():
         """Export self-contained HTML dashboard. Accepts data as POST JSON body."""
-        from export import export_html
         data = request.get_json() or app.raci_data
         if not data:
-            return Response(json.dumps({'error': 'No data'}), status=400, mimetype='application/json')
+            return _json({'error': 'No data'}, 400)
 
         with tempfile.NamedTemporaryFile(suffix='.html', delete=False) as tmp:
             tmp_path = tmp.name
         try:
             export_html(data, tmp_path)
-            with open(tmp_path, 'rb') as f:
-                buf = io.BytesIO(f.read())
-        finally:
-            try:
-                os.unlink(tmp_path)
-            except OSError:
-                pass
-        return send_file(
-            buf,
-            mimetype='text/html',
-            as_attachment=True,
-            download_name='raci-dashboard.html'
-        )
+        except Exception:
+            _unlink_quietly(tmp_path)
+            raise
+        return _send_temp_file(tmp_path, 'text/html', 'raci-dashboard.html')
 
     @app.route('/api/export/powerbi', methods=['POST'])
     def export_powerbi_endpoint():
         """Export Power BI starter kit as a ZIP file. Accepts data as POST JSON body."""
-        from export import export_powerbi
         data = request.get_json() or app.raci_data
         if not data:
-            return Response(json.dumps({'error': 'No data'}), status=400, mimetype='application/json')
+            return _json({'error': 'No data'}, 400)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
+        tmpdir = tempfile.mkdtemp()
+        try:
             files = export_powerbi(data, tmpdir)
-            # Create ZIP in memory
-            buf = io.BytesIO()
-            with zipfile.ZipFile(buf, 'w', zipfile.ZIP_DEFLATED) as zf:
-                for fp in files:
-                    zf.write(fp, os.path.basename(fp))
-            buf.seek(0)
-            return send_file(
-                buf,
-                mimetype='application/zip',
-                as_attachment=True,
-                download_name='raci-powerbi-kit.zip'
-            )
+        except Exception:
+            shutil.rmtree(tmpdir, ignore_errors=True)
+            raise
+        resp = Response(_stream_zip(files), mimetype='application/zip',
+                        headers={'Content-Disposition':
+                                 'attachment; filename=raci-powerbi-kit.zip'})
+        resp.call_on_close(lambda: shutil.rmtree(tmpdir, ignore_errors=True))
+        return resp
 
     @app.route('/api/raci/cell', methods=['PUT'])
     def update_raci_cell():
         """Update a single RACI cell assignment."""
         body = request.get_json()
         if not body or not app.raci_data:
-            return Response(json.dumps({'error': 'No data'}), status=400, mimetype='application/json')
+            return _json({'error': 'No data'}, 400)
         cat_name = body.get('category')
         cap_name = body.get('capability')
         role_id = body.get('role_id')
         value = body.get('value', '')
-        for cat in app.raci_data['categories']:
-            if cat['name'] == cat_name:
-                for item in cat['items']:
-                    if item['name'] == cap_name:
-                        if value and value in ('R', 'A', 'C', 'I'):
-                            item[role_id] = value
-                        elif role_id in item:
-                            del item[role_id]
-                        return Response(json.dumps({'ok': True}), mimetype='application/json')
-        return Response(json.dumps({'error': 'Not found'}), status=404, mimetype='application/json')
+        with app._data_lock:
+            item = _find_item(cat_name, cap_name)
+            if item is not None:
+                _set_cell(item, role_id, value)
+                app._raci_json = None
+                return _json({'ok': True})
+        return _json({'error': 'Not found'}, 404)
+
+    @app.route('/api/raci/cells', methods=['PUT'])
+    def update_raci_cells():
+        """Apply a batch of RACI cell assignments in one request."""
+        body = request.get_json()
+        if not body or not app.raci_data:
+            return _json({'error': 'No data'}, 400)
+        if not isinstance(body, dict):
+            return _json({'error': 'Expected a JSON object with an edits list'}, 400)
+        edits = body.get('edits')
+        if not isinstance(edits, list) or not all(isinstance(e, dict) for e in edits):
+            return _json({'error': 'Expected a list of edits'}, 400)
+        # Validate the whole batch first so a bad edit can't leave it half applied
+        if not all(isinstance(e.get(k), str)
+                   for e in edits for k in ('category', 'capability', 'role_id')):
+            return _json({'error': 'Each edit needs string category, capability and role_id'}, 400)
+        updated = 0
+        not_found = []
+        with app._data_lock:
+            try:
+                for edit in edits:
+                    item = _find_item(edit['category'], edit['capability'])
+                    if item is None:
+                        not_found.append(edit)
+                        continue
+                    _set_cell(item, edit['role_id'], edit.get('value', ''))
+                    updated += 1
+            finally:
+                if updated:
+                    app._raci_json = None
+        return _json({'ok': True, 'updated': updated, 'not_found': not_found})
 
     @app.route('/api/raci/maturity', methods=['PUT'])
     def update_raci_maturity():
         """Update a maturity score (now or tgt) for a capability."""
         body = request.get_json()
         if not body or not app.raci_data:
-            return Response(json.dumps({'error': 'No data'}), status=400, mimetype='application/json')
+            return _json({'error': 'No data'}, 400)
         cat_name = body.get('category')
         cap_name = body.get('capability')
         field = body.get('field')
         value = body.get('value')
         if field not in ('now', 'tgt') or not isinstance(value, int) or value < 0 or value > 5:
-            return Response(json.dumps({'error': 'Invalid field or value'}), status=400, mimetype='application/json')
-        for cat in app.raci_data['categories']:
-            if cat['name'] == cat_name:
-                for item in cat['items']:
-                    if item['name'] == cap_name:
-                        item[field] = value
-                        app.raci_data['meta']['has_maturity'] = True
-                        return Response(json.dumps({'ok': True}), mimetype='application/json')
-        return Response(json.dumps({'error': 'Not found'}), status=404, mimetype='application/json')
+            return _json({'error': 'Invalid field or value'}, 400)
+        with app._data_lock:
+            item = _find_item(cat_name, cap_name)
+            if item is not None:
+                item[field] = value
+                app.raci_data['meta']['has_maturity'] = True
+                app._raci_json = None
+                return _json({'ok': True})
+        return _json({'error': 'Not found'}, 404)
 
     return app
 
 
+def _set_cell(item, role_id, value):
+    """Assign a RACI letter to a role, or clear it for any other value."""
+    if isinstance(value, str) and value in RACI_VALID:
+        item[role_id] = value
+    elif role_id in item:
+        del item[role_id]
+
+
+def _json(obj, status=200):
+    """JSON response serialized with jsonutil.dumps_json (orjson when available)."""
+    return Response(dumps_json(obj), status=status, mimetype='application/json')
+
+
+class _ChunkWriter:
+    """Write-only, unseekable file object that collects bytes for streaming."""
+
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, b):
+        self._chunks.append(bytes(b))
+        return len(b)
+
+    def flush(self):
+        pass
+
+    def drain(self):
+        chunks, self._chunks = self._chunks, []
+        return chunks
+
+
+def _stream_zip(paths):
+    """
+    Yield a deflated ZIP of paths member by member. zipfile writes data
+    descriptors when it cannot seek, so no byte has to be revisited.
+    """
+    out = _ChunkWriter()
+    with zipfile.ZipFile(out, 'w', zipfile.ZIP_DEFLATED) as zf:
+        for fp in paths:
+            zf.write(fp, os.path.basename(fp))
+            yield from out.drain()
+    yield from out.drain()
+
+
+def _send_temp_file(path, mimetype, download_name):
+    """Send a temp file as an attachment and delete it once the response closes."""
+    resp = send_file(path, mimetype=mimetype, as_attachment=True,
+                     download_name=download_name)
+    # Passthrough responses bypass Response.close(), which is what runs
+    # the call_on_close callbacks
+    resp.direct_passthrough = False
+    resp.call_on_close(lambda: _unlink_quietly(path))
+    return resp
+
+
+def _unlink_quietly(path):
+    try:
+        os.unlink(path)
+    except OSError:
+        pass
+
+
 def run_server(data, host='127.0.0.1', port=8080):
+    """
+    Serve the dashboard with waitress when it is installed, otherwise with
+    Werkzeug's threaded server, so a slow upload doesn't block other requests.
+    """
     app = create_app(initial_data=data)
-    app.run(host=host, port=port, debug=False)
+    try:
+        from waitress import serve
+    except ImportError:
+        app.run(host=host, port=port, threaded=True, debug=False)
+    else:
+        serve(app, host=host, port=port, threads=8)
@@ -0,0 +1,93 @@
+// ============================================================
+// RACI Dashboard — Power Query Auto-Import Script
+// ============================================================
+//
+// HOW TO USE:
+//   1. Open Power BI Desktop
+//   2. Home > Transform Data > Advanced Editor
+//   3. Paste this ENTIRE script, replacing the default query
+//   4. Click "Done"
+//   5. In the "Applied Steps" pane you'll see Roles, Capabilities,
+//      and RACI_Assignments tables loaded
+//
+// IMPORTANT: Update the FolderPath below to point to the folder
+//            containing your CSV files.
+// ============================================================
+
+let
+    // *** CHANGE THIS PATH to where you saved the CSV files ***
+    FolderPath = "C:\RACI_PowerBI\",
+
+    // ── Load Roles ──
+    Roles_Raw = Csv.Document(
+        File.Contents(FolderPath & "Roles.csv"),
+        [Delimiter=",", Encoding=65001, QuoteStyle=QuoteStyle.Csv]
+    ),
+    Roles_Headers = Table.PromoteHeaders(Roles_Raw, [PromoteAllScalars=true]),
+    Roles = Table.TransformColumnTypes(Roles_Headers, {
+        {"RoleID", type text},
+        {"RoleLabel", type text},
+        {"RoleShort", type text},
+        {"RoleColor", type text},
+        {"Status", type text}
+    }),
+
+    // ── Load Capabilities ──
+    Capabilities_Raw = Csv.Document(
+        File.Contents(FolderPath & "Capabilities.csv"),
+        [Delimiter=",", Encoding=65001, QuoteStyle=QuoteStyle.Csv]
+    ),
+    Capabilities_Headers = Table.PromoteHeaders(Capabilities_Raw, [PromoteAllScalars=true]),
+    Capabilities = Table.TransformColumnTypes(Capabilities_Headers, {
+        {"CapabilityID", Int64.Type},
+        {"Category", type text},
+        {"CategoryColor", type text},
+        {"Capability", type text},
+        {"Description", type text},
+        {"MaturityNow", type number},
+        {"MaturityTarget", type number},
+        {"MaturityDelta", type number}
+    }),
+
+    // ── Load RACI Assignments ──
+    RACI_Raw = Csv.Document(
+        File.Contents(FolderPath & "RACI_Assignments.csv"),
+        [Delimiter=",", Encoding=65001, QuoteStyle=QuoteStyle.Csv]
+    ),
+    RACI_Headers = Table.PromoteHeaders(RACI_Raw, [PromoteAllScalars=true]),
+    RACI_Assignments = Table.TransformColumnTypes(RACI_Headers, {
+        {"CapabilityID", Int64.Type},
+        {"RoleID", type text},
+        {"Category", type text},
+        {"Capability", type text},
+        {"RoleLabel", type text},
+        {"RACI", type text},
+        {"Weight", Int64.Type},
+        {"IsResponsible", Int64.Type},
+        {"IsAccountable", Int64.Type}
+    })
+in
+    RACI_Assignments
+
+// ============================================================
+// AFTER IMPORT: Create separate queries
+// ============================================================
+// The script above loads RACI_Assignments as the main query.
+// To also get Roles and Capabilities as separate tables:
+//
+//   1. Right-click in the Queries pane > "New Query" > "Blank Query"
+//   2. Open Advanced Editor and paste JUST this for Roles:
+//
+//        let
+//            FolderPath = "C:\RACI_PowerBI\",
+//            Source = Csv.Document(File.Contents(FolderPath & "Roles.csv"),
+//                [Delimiter=",", Encoding=65001, QuoteStyle=QuoteStyle.Csv]),
+//            Headers = Table.PromoteHeaders(Source, [PromoteAllScalars=true])
+//        in
+//            Headers
+//
+//   3. Repeat for Capabilities (change filename to "Capabilities.csv")
+//
+// ALTERNATIVELY (easier): Just use Get Data > Text/CSV three times,
+//   one for each CSV file. The Power Query script above is optional.
+// ============================================================
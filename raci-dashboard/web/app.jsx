@@ -10,6 +10,7 @@ const RACI_LABELS = { R: 'Responsible', A: 'Accountable', C: 'Consulted', I: 'In
 const RACI_WEIGHTS = { R: 4, A: 3, C: 2, I: 1 };
 const MATURITY_COLORS = ['#303840', '#c05050', '#d0a030', '#90c040', '#40b060', '#30a0a0'];
 const MATURITY_LABELS = ['Not Started', 'Initial', 'Developing', 'Defined', 'Managed', 'Optimizing'];
+const CELL_FLUSH_MS = 250; // cell edits made within this window share one PUT
 const VIEWS = [
     { id: 'Heatmap', key: '1', icon: 'grid' },
     { id: 'Sunburst', key: '2', icon: 'circle' },
@@ -1130,6 +1131,27 @@ function App() {
 
     const [editMode, setEditMode] = useState(false);
 
+    const pendingCells = useRef(new Map());
+    const flushTimer = useRef(null);
+
+    const flushCellEdits = useCallback(() => {
+        clearTimeout(flushTimer.current);
+        flushTimer.current = null;
+        const edits = [...pendingCells.current.values()];
+        pendingCells.current.clear();
+        if (!edits.length) return;
+        fetch('/api/raci/cells', {
+            method: 'PUT', headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ edits }), keepalive: true,
+        }).catch(() => {});
+    }, []);
+
+    // Don't lose queued edits when the page is closed
+    useEffect(() => {
+        window.addEventListener('pagehide', flushCellEdits);
+        return () => window.removeEventListener('pagehide', flushCellEdits);
+    }, [flushCellEdits]);
+
     const updateRaciCell = useCallback((category, capability, roleId, value) => {
         setData(prev => {
             const next = JSON.parse(JSON.stringify(prev));
@@ -1144,12 +1166,12 @@ function App() {
             return next;
         });
         if (!window.__RACI_DATA__) {
-            fetch('/api/raci/cell', {
-                method: 'PUT', headers: { 'Content-Type': 'application/json' },
-                body: JSON.stringify({ category, capability, role_id: roleId, value }),
-            }).catch(() => {});
+            // Queue the edit (latest value per cell wins) and send the batch shortly
+            pendingCells.current.set(JSON.stringify([category, capability, roleId]),
+                { category, capability, role_id: roleId, value });
+            if (!flushTimer.current) flushTimer.current = setTimeout(flushCellEdits, CELL_FLUSH_MS);
         }
-    }, []);
+    }, [flushCellEdits]);
 
     const updateMaturity = useCallback((category, capability, field, value) => {
         setData(prev => {